@@ -3,6 +3,9 @@
 # Extracted from ColorGradientTool.py
 
 import math
+import re
+from bisect import bisect_right
+from functools import lru_cache
 from coloraide import Color
 import colorsys
 
@@ -23,21 +26,61 @@ def linear_comp_to_srgb(c):
         return 1.055 * (c ** (1 / 2.4)) - 0.055
 
 
+def _linear_comp_to_srgb8(c):
+    # Reference 8-bit encoding used to build the lookup tables below
+    return max(0, min(255, int(round(linear_comp_to_srgb(c) * 255))))
+
+
+def _srgb8_threshold(k):
+    # Smallest linear value that encodes to 8-bit sRGB value k + 1.
+    # Start from the analytic midpoint and nudge by one ulp until exact.
+    c = srgb_comp_to_linear((k + 0.5) / 255.0)
+    while _linear_comp_to_srgb8(c) > k:
+        c = math.nextafter(c, -math.inf)
+    while _linear_comp_to_srgb8(c) <= k:
+        c = math.nextafter(c, math.inf)
+    return c
+
+
+# 8-bit sRGB -> linear lookup table (hex inputs are always 8-bit per channel)
+SRGB8_TO_LINEAR = tuple(srgb_comp_to_linear(i / 255.0) for i in range(256))
+# Decision thresholds for linear -> 8-bit sRGB; bisecting them gives the same
+# byte as linear_comp_to_srgb + rounding, without calling pow()
+LINEAR_TO_SRGB8_THRESHOLDS = tuple(_srgb8_threshold(k) for k in range(255))
+
+
+def linear_comp_to_srgb8(c):
+    """Encode a linear component to an 8-bit sRGB value (0-255)"""
+    return bisect_right(LINEAR_TO_SRGB8_THRESHOLDS, c)
+
+
+@lru_cache(maxsize=1024)
 def hex_to_rgb01(hexstr):
-    hexstr = hexstr.lstrip('#')
-    r = int(hexstr[0:2], 16) / 255.0
-    g = int(hexstr[2:4], 16) / 255.0
-    b = int(hexstr[4:6], 16) / 255.0
-    return (r, g, b)
+    r, g, b = bytes.fromhex(hexstr.lstrip('#')[:6])
+    return (r / 255.0, g / 255.0, b / 255.0)
+
+
+def hex_to_linear_rgb(hexstr):
+    """Convert hex color to linear sRGB (0-1) through SRGB8_TO_LINEAR"""
+    r, g, b = bytes.fromhex(hexstr.lstrip('#')[:6])
+    t = SRGB8_TO_LINEAR
+    return (t[r], t[g], t[b])
+
+
+# Two-digit lowercase hex string for every byte value
+HEX_BYTE_STRINGS = tuple(f'{i:02x}' for i in range(256))
 
 
 def rgb01_to_hex(rgb):
     r, g, b = rgb
-    return '#{:02x}{:02x}{:02x}'.format(
-        max(0, min(255, int(round(r * 255)))),
-        max(0, min(255, int(round(g * 255)))),
-        max(0, min(255, int(round(b * 255))))
-    )
+    r = round(r * 255)
+    g = round(g * 255)
+    b = round(b * 255)
+    h = HEX_BYTE_STRINGS
+    return ('#'
+            + h[0 if r < 0 else 255 if r > 255 else r]
+            + h[0 if g < 0 else 255 if g > 255 else g]
+            + h[0 if b < 0 else 255 if b > 255 else b])
 
 
 def lerp(a, b, t):
@@ -50,12 +93,10 @@ def shortest_angle_interp(a1, a2, t):
     return (a1 + d * t) % 360
 
 
+@lru_cache(maxsize=1024)
 def hex_to_rgb256(hex_color):
     """Convert hex color to RGB 256 format (0-255)"""
-    hex_color = hex_color.lstrip('#')
-    r = int(hex_color[0:2], 16)
-    g = int(hex_color[2:4], 16)
-    b = int(hex_color[4:6], 16)
+    r, g, b = bytes.fromhex(hex_color.lstrip('#')[:6])
     return f"rgb({r}, {g}, {b})"
 
 
@@ -99,30 +140,41 @@ def parse_hex_string(s):
         h = ''.join(c*2 for c in h)
     if len(h) != 6:
         raise ValueError('Hex must be 6 digits')
-    int(h, 16)  # validate
+    # validate (bytes.fromhex skips spaces, so also check the byte count)
+    if len(bytes.fromhex(h)) != 3:
+        raise ValueError('Hex must be 6 digits')
     return '#' + h.lower()
 
 
+def _format_rgb01_component(v):
+    # format numbers with up to 5 decimals, strip trailing zeros
+    # Keep a leading zero for values like 0.335 (do not drop the leading 0)
+    return f"{v:.5f}".rstrip('0').rstrip('.')
+
+
+# Preformatted strings for the 256 values an 8-bit channel maps to (i/255)
+RGB01_COMPONENT_STRINGS = {i / 255.0: _format_rgb01_component(i / 255.0) for i in range(256)}
+
+
 def format_rgb01_from_tuple(t):
-    # format numbers with up to 5 decimals, strip trailing zeros, drop leading zero
-    def fmt(v):
-        # Keep a leading zero for values like 0.335 (do not drop the leading 0)
-        s = f"{v:.5f}".rstrip('0').rstrip('.')
-        return s
-    return ', '.join(fmt(x) for x in t)
+    get = RGB01_COMPONENT_STRINGS.get
+    return ', '.join([get(x) or _format_rgb01_component(x) for x in t])
 
 
 def format_rgb256_from_tuple(t):
     return ', '.join(str(int(x)) for x in t)
 
 
+# 3-decimal RGB 0-1 strings for every 8-bit channel value (used when copying)
+RGB01_3DP_STRINGS = tuple(f'{i / 255.0:.3f}' for i in range(256))
+
+
 def hex_to_rgb01_string(hex_color):
     """Convert hex color to RGB 0-1 format string"""
-    hex_color = hex_color.lstrip('#')
-    r = int(hex_color[0:2], 16) / 255.0
-    g = int(hex_color[2:4], 16) / 255.0
-    b = int(hex_color[4:6], 16) / 255.0
-    return f"rgb({r:.3f}, {g:.3f}, {b:.3f})"
+    r, g, b = bytes.fromhex(hex_color.lstrip('#')[:6])
+    t = RGB01_3DP_STRINGS
+    r, g, b = t[r], t[g], t[b]
+    return f"rgb({r}, {g}, {b})"
 
 
 def format_color_list(colors, format_type):
@@ -137,7 +189,28 @@ def format_color_list(colors, format_type):
         return colors
 
 
-CYLINDRICAL_SPACES = {'lch', 'oklch', 'hsl', 'hwb', 'hsv'}
+def interpolation_steps(steps):
+    """Return the interpolation parameter t for each of `steps` steps (0..1)"""
+    if steps > 1:
+        d = steps - 1
+        return [i / d for i in range(steps)]
+    return [0] * steps
+
+
+# Mixing two sRGB colors in these spaces always stays inside sRGB (their
+# coordinates are bounded boxes/cylinders over the sRGB cube), so gamut
+# fitting can be skipped when serializing
+SRGB_BOUNDED_SPACES = ('hsl', 'hwb')
+
+
+@lru_cache(maxsize=64)
+def _coloraide_interpolator(hex_a, hex_b, space):
+    # coloraide converts the endpoints once and handles the hue channel of
+    # cylindrical spaces (shortest arc, achromatic colors) itself. Cached so
+    # repeated gradients between the same endpoints skip that setup.
+    # Alpha of '#rrggbbaa' endpoints must not tint the colors (the stops are
+    # opaque), so interpolate without premultiplying.
+    return Color.interpolate([hex_a, hex_b], space=space, hue='shorter', out_space='srgb', premultiplied=False)
 
 
 def interpolate_coloraide(hex_a, hex_b, steps, space):
@@ -146,37 +219,16 @@ def interpolate_coloraide(hex_a, hex_b, steps, space):
     space: e.g. 'oklch', 'oklab', 'lch', 'lab', 'hsl', 'hwb', 'srgb'
     Returns list of hex strings length == steps
     """
-    ca = Color(hex_a)
-    cb = Color(hex_b)
-    # Convert endpoints into desired space
-    a_conv = ca.convert(space)
-    b_conv = cb.convert(space)
-
-    a_coords = list(a_conv.coords())
-    b_coords = list(b_conv.coords())
+    interp = _coloraide_interpolator(hex_a, hex_b, space)
+    # Endpoints are hex colors, so they are always in sRGB gamut
+    fit = space not in SRGB_BOUNDED_SPACES
 
     out = []
-    is_cyl = space.lower() in CYLINDRICAL_SPACES
-    hue_index = (len(a_coords) - 1) if is_cyl else None
-
-    for i in range(steps):
-        t = i / (steps - 1) if steps > 1 else 0
-        coords = []
-        for j in range(len(a_coords)):
-            if j == hue_index:
-                a_h = (a_coords[j] % 360)
-                b_h = (b_coords[j] % 360)
-                h = shortest_angle_interp(a_h, b_h, t)
-                coords.append(h)
-            else:
-                coords.append(lerp(a_coords[j], b_coords[j], t))
+    for t in interpolation_steps(steps):
         try:
-            c = Color(space, coords)
-            # Fit to sRGB if out of gamut for display
-            if not c.in_gamut('srgb'):
-                c = c.fit('srgb')
-            hex_out = c.convert('srgb').to_string(hex=True)
-            out.append(hex_out)
+            # to_string() fits out-of-gamut colors to sRGB for display;
+            # stops are always '#rrggbb', even for '#rrggbbaa' endpoints
+            out.append(interp(t).to_string(hex=True, fit=fit, alpha=False))
         except Exception:
             # fallback to endpoints if something fails
             out.append(hex_a if t < 0.5 else hex_b)
@@ -187,28 +239,153 @@ def interpolate_srgb_linear(hex_a, hex_b, steps):
     """
     Interpolate in linear sRGB space (physically additive) using correct sRGB linearization.
     """
-    ar, ag, ab = hex_to_rgb01(hex_a)
-    br, bg, bb = hex_to_rgb01(hex_b)
-    la = (srgb_comp_to_linear(ar), srgb_comp_to_linear(ag), srgb_comp_to_linear(ab))
-    lb = (srgb_comp_to_linear(br), srgb_comp_to_linear(bg), srgb_comp_to_linear(bb))
+    la = hex_to_linear_rgb(hex_a)
+    lb = hex_to_linear_rgb(hex_b)
+    ts = interpolation_steps(steps)
+    # Interpolate and encode one channel over all steps at a time, then zip
+    # the three channel columns into hex strings
+    thresholds = LINEAR_TO_SRGB8_THRESHOLDS
+    channels = [[bisect_right(thresholds, a + (b - a) * t) for t in ts] for a, b in zip(la, lb)]
+    h = HEX_BYTE_STRINGS
+    return ['#' + h[r] + h[g] + h[b] for r, g, b in zip(*channels)]
+
+
+# ========== OKLAB / OKLCH FAST PATH ==========
+# OKLab and OKLCH are the most used modes. Their conversion from sRGB is a
+# few 3x3 matrix products and a cube root, so it is done directly here
+# instead of building coloraide Color objects for every step. The matrices
+# and the order of operations mirror coloraide's
+# srgb-linear -> xyz-d65 -> oklab chain, so the output is the same.
+
+LINEAR_SRGB_TO_XYZ = (
+    (0.4123907992659593, 0.357584339383878, 0.1804807884018343),
+    (0.21263900587151024, 0.715168678767756, 0.07219231536073371),
+    (0.01933081871559182, 0.11919477979462598, 0.9505321522496607),
+)
+XYZ_TO_LINEAR_SRGB = (
+    (3.240969941904523, -1.5373831775700941, -0.4986107602930035),
+    (-0.9692436362808797, 1.8759675015077204, 0.04155505740717562),
+    (0.05563007969699365, -0.20397695888897652, 1.0569715142428784),
+)
+XYZ_TO_LMS = (
+    (0.819022437996703, 0.3619062600528904, -0.1288737815209879),
+    (0.03298365393238847, 0.9292868615863434, 0.03614466635064236),
+    (0.04817718935962421, 0.2642395317527308, 0.6335478284694309),
+)
+LMS_TO_XYZ = (
+    (1.226879875845924, -0.5578149944602171, 0.2813910456659647),
+    (-0.04057574521480083, 1.112286803280317, -0.07171105806551635),
+    (-0.07637293667466008, -0.42149333240224324, 1.5869240198367818),
+)
+LMS3_TO_OKLAB = (
+    (0.21045426830931396, 0.7936177747023053, -0.0040720430116192585),
+    (1.9779985324311686, -2.42859224204858, 0.450593709617411),
+    (0.025904042465547734, 0.7827717124575297, -0.8086757549230774),
+)
+OKLAB_TO_LMS3 = (
+    (1.0, 0.3963377773761749, 0.21580375730991364),
+    (1.0, -0.10556134581565857, -0.0638541728258133),
+    (1.0, -0.08948417752981186, -1.2914855480194092),
+)
+# OKLCH hue is undefined (achromatic) below this chroma, as in coloraide
+OKLCH_ACHROMATIC_THRESHOLD = 0.1 / 1_000_000
+
+
+def _mat3_mul(m, v):
+    x, y, z = v
+    return (
+        m[0][0] * x + m[0][1] * y + m[0][2] * z,
+        m[1][0] * x + m[1][1] * y + m[1][2] * z,
+        m[2][0] * x + m[2][1] * y + m[2][2] * z,
+    )
+
+
+def _cbrt(c):
+    return math.copysign(abs(c) ** (1 / 3), c) if c else 0.0
+
+
+def hex_to_oklab(hexstr):
+    """Convert hex color to OKLab (L, a, b)"""
+    lin = hex_to_linear_rgb(hexstr)
+    lms = _mat3_mul(XYZ_TO_LMS, _mat3_mul(LINEAR_SRGB_TO_XYZ, lin))
+    return _mat3_mul(LMS3_TO_OKLAB, tuple(_cbrt(c) for c in lms))
+
+
+def oklab_to_linear_rgb(lab):
+    """Convert OKLab (L, a, b) to linear sRGB (unclipped)"""
+    lms = tuple(c ** 3 for c in _mat3_mul(OKLAB_TO_LMS3, lab))
+    return _mat3_mul(XYZ_TO_LINEAR_SRGB, _mat3_mul(LMS_TO_XYZ, lms))
+
+
+def _oklab_to_oklch(lab):
+    l, a, b = lab
+    c = math.sqrt(a ** 2 + b ** 2)
+    if abs(c) < OKLCH_ACHROMATIC_THRESHOLD:
+        return (l, c, math.nan)
+    return (l, c, math.degrees(math.atan2(b, a)) % 360)
+
+
+def interpolate_oklab(hex_a, hex_b, steps, space):
+    """
+    Interpolate in 'oklab' or 'oklch' without per-step coloraide objects.
+    Steps that fall outside sRGB are delegated to coloraide for gamut mapping,
+    so the result matches interpolate_coloraide().
+    """
+    a = hex_to_oklab(hex_a)
+    b = hex_to_oklab(hex_b)
+    is_lch = space == 'oklch'
+    if is_lch:
+        a = _oklab_to_oklch(a)
+        b = _oklab_to_oklch(b)
+        ha, hb = a[2], b[2]
+        # An undefined hue takes the other endpoint's hue; then take the shorter arc
+        if math.isnan(ha):
+            ha = hb
+        elif math.isnan(hb):
+            hb = ha
+        if not math.isnan(ha):
+            ha %= 360
+            hb %= 360
+            if hb - ha > 180:
+                ha += 360
+            elif hb - ha < -180:
+                hb += 360
+        a = (a[0], a[1], ha)
+        b = (b[0], b[1], hb)
+
+    thresholds = LINEAR_TO_SRGB8_THRESHOLDS
+    h = HEX_BYTE_STRINGS
     out = []
-    for i in range(steps):
-        t = i / (steps - 1) if steps > 1 else 0
-        lr = lerp(la[0], lb[0], t)
-        lg = lerp(la[1], lb[1], t)
-        lbv = lerp(la[2], lb[2], t)
-        r = linear_comp_to_srgb(lr)
-        g = linear_comp_to_srgb(lg)
-        b = linear_comp_to_srgb(lbv)
-        out.append(rgb01_to_hex((r, g, b)))
+    for t in interpolation_steps(steps):
+        lab = tuple(p + (q - p) * t for p, q in zip(a, b))
+        if is_lch:
+            l, c, hue = lab
+            hue = math.radians(0.0 if math.isnan(hue) else hue)
+            lab = (l, c * math.cos(hue), c * math.sin(hue))
+        r, g, bl = oklab_to_linear_rgb(lab)
+        if 0.0 <= r <= 1.0 and 0.0 <= g <= 1.0 and 0.0 <= bl <= 1.0:
+            out.append('#' + h[bisect_right(thresholds, r)]
+                       + h[bisect_right(thresholds, g)]
+                       + h[bisect_right(thresholds, bl)])
+            continue
+        try:
+            # Out of gamut: let coloraide fit it to sRGB
+            out.append(_coloraide_interpolator(hex_a, hex_b, space)(t).to_string(hex=True, alpha=False))
+        except Exception:
+            # fallback to endpoints if something fails
+            out.append(hex_a if t < 0.5 else hex_b)
     return out
 
 
+# Hex colors the OKLab fast path can parse: 6 digits, optionally followed by alpha
+HEX_RGB_RE = re.compile(r'#?[0-9a-fA-F]{6}(?:[0-9a-fA-F]{2})?')
+
+
 def interpolate(hex_a, hex_b, steps, mode):
     m = mode.lower()
     if m == 'srgb' or m == 'rgb':
         return interpolate_srgb_linear(hex_a, hex_b, steps)
-    # For everything else use coloraide's conversions and fitting
+    # Everything else is interpolated in a perceptual/cylindrical space.
     # Map friendly names to coloraide spaces
     mapping = {
         'oklch': 'oklch',
@@ -219,56 +396,80 @@ def interpolate(hex_a, hex_b, steps, mode):
         'hwb': 'hwb',
     }
     space = mapping.get(m, m)
+    # OKLab/OKLCH use the pure-Python fast path, which only parses
+    # '#rrggbb'/'#rrggbbaa'. Other endpoints ('#fff', 'red', ...) and all
+    # other spaces go through coloraide's conversions and gamut fitting.
+    if space in ('oklab', 'oklch') and HEX_RGB_RE.fullmatch(hex_a) and HEX_RGB_RE.fullmatch(hex_b):
+        return interpolate_oklab(hex_a, hex_b, steps, space)
     return interpolate_coloraide(hex_a, hex_b, steps, space)
 
 
+@lru_cache(maxsize=128)
+def interpolate_cached(hex_a, hex_b, steps, mode):
+    """Memoized interpolate(); returns a tuple so cached results cannot be mutated"""
+    return tuple(interpolate(hex_a, hex_b, steps, mode))
+
+
 class ColorParser:
     """Static class for parsing color format lines"""
     
+    # Each method parses all lines first, then builds the three output
+    # columns in one pass each
+
     @staticmethod
     def parse_hex_lines(lines):
-        out_hex = []
-        out_rgb256 = []
-        out_rgb01 = []
-        for line in lines:
-            hx = parse_hex_string(line)
-            out_hex.append(hx)
-            r01 = hex_to_rgb01(hx)
-            out_rgb01.append(format_rgb01_from_tuple(r01))
-            out_rgb256.append(format_rgb256_from_tuple(tuple(int(round(x*255)) for x in r01)))
+        out_hex = [parse_hex_string(line) for line in lines]
+        rgb256 = [tuple(bytes.fromhex(hx[1:])) for hx in out_hex]
+        out_rgb256 = [format_rgb256_from_tuple(vals) for vals in rgb256]
+        out_rgb01 = [format_rgb01_from_tuple(hex_to_rgb01(hx)) for hx in out_hex]
         return out_hex, out_rgb256, out_rgb01
 
     @staticmethod
     def parse_rgb256_lines(lines):
-        out_hex = []
-        out_rgb256 = []
-        out_rgb01 = []
-        for line in lines:
-            vals = parse_rgb256_string(line)
-            # ensure each component is in 0-255 (parse_rgb256_string already checks)
-            out_rgb256.append(format_rgb256_from_tuple(vals))
-            r01 = tuple(v/255.0 for v in vals)
-            out_rgb01.append(format_rgb01_from_tuple(r01))
-            out_hex.append(rgb01_to_hex(r01))
+        # parse_rgb256_string checks each component is in 0-255
+        rgb256 = [parse_rgb256_string(line) for line in lines]
+        h = HEX_BYTE_STRINGS
+        out_hex = ['#' + h[r] + h[g] + h[b] for r, g, b in rgb256]
+        out_rgb256 = [format_rgb256_from_tuple(vals) for vals in rgb256]
+        out_rgb01 = [format_rgb01_from_tuple((r / 255.0, g / 255.0, b / 255.0)) for r, g, b in rgb256]
         return out_hex, out_rgb256, out_rgb01
 
     @staticmethod
     def parse_rgb01_lines(lines):
-        out_hex = []
-        out_rgb256 = []
-        out_rgb01 = []
-        for line in lines:
-            vals = parse_rgb01_string(line)
-            # ensure floats within [0,1] (parse_rgb01_string checks)
-            out_rgb01.append(format_rgb01_from_tuple(vals))
-            out_rgb256.append(format_rgb256_from_tuple(tuple(int(round(v*255)) for v in vals)))
-            out_hex.append(rgb01_to_hex(vals))
+        # parse_rgb01_string checks floats are within [0,1]
+        rgb01 = [parse_rgb01_string(line) for line in lines]
+        out_hex = [rgb01_to_hex(vals) for vals in rgb01]
+        out_rgb256 = [format_rgb256_from_tuple(tuple(int(round(v*255)) for v in vals)) for vals in rgb01]
+        out_rgb01 = [format_rgb01_from_tuple(vals) for vals in rgb01]
         return out_hex, out_rgb256, out_rgb01
 
 
 # ========== INPUT ADAPTER FUNCTIONS ==========
 # These functions handle various popular color input formats with different delimiters and brackets
 
+# Patterns are compiled once at import; the adapter runs on every conversion
+# Colors are separated by: newline OR comma followed by newline OR semicolon followed by newline
+COLOR_DELIMITER_RE = re.compile(r'(?:,\s*\n|\;\s*\n|\n)')
+
+# RGB values in various formats, tried in order:
+# - rgb(1, 2, 3) or RGB(1, 2, 3)
+# - rgb[1, 2, 3] or RGB[1, 2, 3]
+# - rgb{1, 2, 3} or RGB{1, 2, 3}
+# - (1, 2, 3)
+# - [1, 2, 3]
+# - {1, 2, 3}
+RGB_VALUE_PATTERNS = tuple(re.compile(p) for p in (
+    r'(?i)rgb\s*\(\s*([\d.]+)\s*,\s*([\d.]+)\s*,\s*([\d.]+)\s*\)',  # rgb(r,g,b)
+    r'(?i)rgb\s*\[\s*([\d.]+)\s*,\s*([\d.]+)\s*,\s*([\d.]+)\s*\]',  # rgb[r,g,b]
+    r'(?i)rgb\s*\{\s*([\d.]+)\s*,\s*([\d.]+)\s*,\s*([\d.]+)\s*\}',  # rgb{r,g,b}
+    r'\(\s*([\d.]+)\s*,\s*([\d.]+)\s*,\s*([\d.]+)\s*\)',  # (r,g,b)
+    r'\[\s*([\d.]+)\s*,\s*([\d.]+)\s*,\s*([\d.]+)\s*\]',  # [r,g,b]
+    r'\{\s*([\d.]+)\s*,\s*([\d.]+)\s*,\s*([\d.]+)\s*\}',  # {r,g,b}
+))
+# Bare-bones format (just numbers and commas): 1, 2, 3
+BARE_RGB_RE = re.compile(r'^\s*([\d.]+)\s*,\s*([\d.]+)\s*,\s*([\d.]+)\s*$')
+
+
 class ColorInputAdapter:
     """
     Input adapter for handling various popular color formatting patterns.
@@ -291,9 +492,7 @@ class ColorInputAdapter:
             return []
         
         # Split by color delimiters: newline, comma+newline, semicolon+newline
-        import re
-        # Split on: newline OR comma followed by newline OR semicolon followed by newline
-        colors = re.split(r'(?:,\s*\n|\;\s*\n|\n)', input_text.strip())
+        colors = COLOR_DELIMITER_RE.split(input_text.strip())
         
         # Clean and validate each color
         cleaned_colors = []
@@ -335,11 +534,8 @@ class ColorInputAdapter:
         if not input_text or not input_text.strip():
             return []
         
-        import re
-        
         # Split by color delimiters: newline, comma+newline, semicolon+newline
-        # Split on: newline OR comma followed by newline OR semicolon followed by newline
-        lines = re.split(r'(?:,\s*\n|\;\s*\n|\n)', input_text.strip())
+        lines = COLOR_DELIMITER_RE.split(input_text.strip())
         
         cleaned_colors = []
         for line in lines:
@@ -372,45 +568,62 @@ class ColorInputAdapter:
         Extract RGB numeric values from a line with various bracket formats.
         Returns list of 3 numeric strings or None if not found.
         """
-        import re
-        
-        # Pattern to match RGB values in various formats:
-        # - rgb(1, 2, 3) or RGB(1, 2, 3)
-        # - rgb[1, 2, 3] or RGB[1, 2, 3]  
-        # - rgb{1, 2, 3} or RGB{1, 2, 3}
-        # - (1, 2, 3)
-        # - [1, 2, 3]
-        # - {1, 2, 3}
-        # - 1, 2, 3 (bare-bones)
-        
-        # Try RGB prefix patterns first (case insensitive)
-        rgb_patterns = [
-            r'(?i)rgb\s*\(\s*([\d.]+)\s*,\s*([\d.]+)\s*,\s*([\d.]+)\s*\)',  # rgb(r,g,b)
-            r'(?i)rgb\s*\[\s*([\d.]+)\s*,\s*([\d.]+)\s*,\s*([\d.]+)\s*\]',  # rgb[r,g,b]
-            r'(?i)rgb\s*\{\s*([\d.]+)\s*,\s*([\d.]+)\s*,\s*([\d.]+)\s*\}',  # rgb{r,g,b}
-        ]
-        
-        for pattern in rgb_patterns:
-            match = re.search(pattern, line)
-            if match:
-                return [match.group(1), match.group(2), match.group(3)]
-        
-        # Try bracket patterns without rgb prefix
-        bracket_patterns = [
-            r'\(\s*([\d.]+)\s*,\s*([\d.]+)\s*,\s*([\d.]+)\s*\)',  # (r,g,b)
-            r'\[\s*([\d.]+)\s*,\s*([\d.]+)\s*,\s*([\d.]+)\s*\]',  # [r,g,b]
-            r'\{\s*([\d.]+)\s*,\s*([\d.]+)\s*,\s*([\d.]+)\s*\}',  # {r,g,b}
-        ]
-        
-        for pattern in bracket_patterns:
-            match = re.search(pattern, line)
+        # RGB prefix patterns first (case insensitive), then plain brackets
+        for pattern in RGB_VALUE_PATTERNS:
+            match = pattern.search(line)
             if match:
                 return [match.group(1), match.group(2), match.group(3)]
         
         # Try bare-bones format (just numbers and commas)
-        bare_pattern = r'^\s*([\d.]+)\s*,\s*([\d.]+)\s*,\s*([\d.]+)\s*$'
-        match = re.match(bare_pattern, line)
+        match = BARE_RGB_RE.match(line)
         if match:
             return [match.group(1), match.group(2), match.group(3)]
         
-        return None
\ No newline at end of file
+        return None
+
+
+# ========== CONVERTER FUNCTIONS ==========
+# Pure text -> text transforms behind the converter boxes in main.py.
+# Memoized on the input text so re-converting unchanged text (e.g. switching
+# the source box back and forth) does no parsing or formatting.
+
+@lru_cache(maxsize=16)
+def convert_hex_text(text):
+    """Convert Hex box text into (hexs, rgb256, rgb01) tuples of output lines"""
+    hex_colors = ColorInputAdapter.parse_hex_input(text)
+    if not hex_colors:
+        raise ValueError('No valid hex colors found')
+    hexs = tuple(hex_colors)
+    r256 = tuple(format_rgb256_from_tuple(bytes.fromhex(h[1:])) for h in hexs)
+    r01 = tuple(format_rgb01_from_tuple(hex_to_rgb01(h)) for h in hexs)
+    return hexs, r256, r01
+
+
+@lru_cache(maxsize=16)
+def convert_rgb256_text(text):
+    """Convert RGB 256 box text into (hexs, rgb256, rgb01) tuples of output lines"""
+    rgb256_tuples = ColorInputAdapter.parse_rgb_input(text, is_rgb256=True)
+    if not rgb256_tuples:
+        raise ValueError('No valid RGB 256 colors found')
+    h = HEX_BYTE_STRINGS
+    hexs = tuple('#' + h[r] + h[g] + h[b] for r, g, b in rgb256_tuples)
+    r256 = tuple(format_rgb256_from_tuple(t) for t in rgb256_tuples)
+    r01 = tuple(format_rgb01_from_tuple((r/255.0, g/255.0, b/255.0)) for r, g, b in rgb256_tuples)
+    return hexs, r256, r01
+
+
+@lru_cache(maxsize=16)
+def convert_rgb01_text(text):
+    """Convert RGB 0-1 box text into (hexs, rgb256, rgb01) tuples of output lines"""
+    rgb01_tuples = ColorInputAdapter.parse_rgb_input(text, is_rgb256=False)
+    if not rgb01_tuples:
+        raise ValueError('No valid RGB 0-1 colors found')
+    # Quantize once for both the Hex and RGB 256 columns; the adapter only
+    # accepts components within [0, 1], so no clamping is needed
+    q = [(round(r*255), round(g*255), round(b*255)) for r, g, b in rgb01_tuples]
+    h = HEX_BYTE_STRINGS
+    hexs = tuple('#' + h[r] + h[g] + h[b] for r, g, b in q)
+    r256 = tuple(format_rgb256_from_tuple(t) for t in q)
+    # format_rgb01_from_tuple already keeps the leading zero (0.157, not .157)
+    r01 = tuple(format_rgb01_from_tuple(t) for t in rgb01_tuples)
+    return hexs, r256, r01
@@ -26,23 +26,25 @@ import sys
 import math
 import os
 import platform
+from functools import lru_cache
 from PySide6.QtWidgets import (
     QApplication, QWidget, QLabel, QPushButton, QComboBox, QColorDialog,
-    QHBoxLayout, QVBoxLayout, QGridLayout, QSizePolicy, QStatusBar, QTextEdit
+    QHBoxLayout, QVBoxLayout, QGridLayout, QSizePolicy, QStatusBar, QPlainTextEdit, QMessageBox
 )
-from PySide6.QtGui import QColor, QPainter, QPixmap, QIcon, QPainterPath
-from PySide6.QtCore import Qt, QSize, Signal
+from PySide6.QtGui import QColor, QPainter, QPixmap, QIcon, QPainterPath, QImage
+from PySide6.QtCore import Qt, QSize, QRect, QTimer, Signal
 from pathlib import Path
 
 # Import our modules
 from color import (
-    interpolate, format_color_list, ColorParser, ColorInputAdapter,
-    lerp, parse_hex_string, hex_to_rgb01, rgb01_to_hex,
-    format_rgb01_from_tuple, format_rgb256_from_tuple
+    interpolate_cached, format_color_list, ColorParser,
+    lerp, parse_hex_string,
+    convert_hex_text, convert_rgb256_text, convert_rgb01_text
 )
 from settings import Settings
 
 
+@lru_cache(maxsize=None)
 def get_platform_font_family():
     """
     Return the appropriate font family for the current platform.
@@ -59,6 +61,7 @@ def get_platform_font_family():
         return '"Ubuntu", "Liberation Sans", Arial, sans-serif'
 
 
+@lru_cache(maxsize=None)
 def get_platform_monospace_font():
     """
     Return the appropriate monospace font family for the current platform.
@@ -128,6 +131,17 @@ MINIMUM_WINDOW_HEIGHT = 560     # Minimum window height in pixels
 # UI color constants
 LINK_COLOR = '#4CA7F8' #'#4588C4'          # Color for clickable link-style labels and highlights
 
+# Help text shown as the Color space [?] tooltip and in its click dialog
+COLOR_SPACE_HELP_HTML = """
+<b>Color space descriptions</b><br><br>
+OKLCH — OKLCH (OKLab LCh) — Perceptual Lightness‑Chroma‑Hue (based on the OKLab color space; good for perceptual interpolation)<br><br>
+OKLab — OKLab — Perceptual L‑a‑b color space (lightness and two opponent axes; designed for more uniform perceived differences)<br><br>
+LCh — LCh (CIE LCh / LCh(ab)) — Lightness‑Chroma‑Hue (cylindrical form of CIE Lab*; useful for intuitive hue/chroma edits)<br><br>
+Lab — CIE Lab* (Lab) — Lightness and two color opponent channels (device‑independent, perceptually oriented)<br><br>
+HWB — HWB — Hue‑Whiteness‑Blackness (simple paint‑like model: mix hue with white and black; intuitive for designers)<br><br>
+HSL — HSL — Hue‑Saturation‑Lightness (common cylindrical RGB model for adjusting hue and perceived lightness)
+"""
+
 
 class GradientPreview(QLabel):
     def __init__(self, parent=None, border_radius=4):
@@ -136,18 +150,49 @@ class GradientPreview(QLabel):
         self.setFixedHeight(GRADIENT_PREVIEW_HEIGHT)
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self._colors = ['#ff0000', '#0000ff']
+        self._stop_channels = self._split_channels(self._colors)
         self.border_radius = border_radius
         # Apply rounded corners styling
         self.setStyleSheet(f'border-radius: {self.border_radius}px;')
+        # Window drags fire many resize events; re-render once they settle
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(30)
+        self._resize_timer.timeout.connect(self.update_preview)
+        # Rendered pixmaps for the current colors, keyed by (w, h, border_radius)
+        self._pixmap_cache = {}
+
+    @staticmethod
+    def _split_channels(colors):
+        """Parse '#rrggbb' colors into separate (reds, greens, blues) channel tuples"""
+        # bytes.fromhex stays in C instead of building a QColor for every stop
+        stops_rgb = [bytes.fromhex(c.lstrip('#')) for c in colors]
+        return tuple(zip(*stops_rgb))
 
     def set_colors(self, colors):
         self._colors = colors
+        # Parse the stops once here rather than on every resize/repaint
+        stop_channels = self._split_channels(colors)
+        if stop_channels != self._stop_channels:
+            self._stop_channels = stop_channels
+            self._pixmap_cache.clear()
         self.update_preview()
 
     def update_preview(self):
         w = max(200, self.width())
         # Use the widget's actual height (fixed to match swatches)
         h = max(1, self.height())
+        key = (w, h, self.border_radius)
+        pix = self._pixmap_cache.get(key)
+        if pix is None:
+            pix = self._render_pixmap(w, h)
+            # Keep a few recent sizes so resizing back and forth reuses them
+            if len(self._pixmap_cache) >= 8:
+                del self._pixmap_cache[next(iter(self._pixmap_cache))]
+            self._pixmap_cache[key] = pix
+        self.setPixmap(pix)
+
+    def _render_pixmap(self, w, h):
         pix = QPixmap(w, h)
         pix.fill(Qt.transparent)  # Start with transparent background
         painter = QPainter(pix)
@@ -158,44 +203,82 @@ class GradientPreview(QLabel):
         path.addRoundedRect(0, 0, w, h, self.border_radius, self.border_radius)
         painter.setClipPath(path)
         
-        # Draw gradient within the clipped rounded rectangle
-        img = pix.toImage()
-        steps = len(self._colors)
-        stops_rgb = [QColor(c).getRgb() for c in self._colors]
+        # Draw gradient within the clipped rounded rectangle.
+        # The gradient is horizontal, so compute a single RGB888 scanline and
+        # let Qt stretch it over the full height instead of setting each pixel.
+        # Sample positions are shared by all channels; each channel is then
+        # written into every third byte of the row in one slice assignment
+        steps = len(self._stop_channels[0])
+        segments = []
         for x in range(w):
             t = x / (w - 1) if w > 1 else 0
             pos = t * (steps - 1)
             i = int(math.floor(pos))
             j = min(steps - 1, i + 1)
-            local_t = pos - i
-            c1 = stops_rgb[i]
-            c2 = stops_rgb[j]
-            r = int(round(lerp(c1[0], c2[0], local_t)))
-            g = int(round(lerp(c1[1], c2[1], local_t)))
-            b = int(round(lerp(c1[2], c2[2], local_t)))
-            for y in range(h):
-                img.setPixelColor(x, y, QColor(r, g, b))
-        painter.drawImage(0, 0, img)
+            segments.append((i, j, pos - i))
+        row = bytearray(3 * w)
+        for k, channel in enumerate(self._stop_channels):
+            row[k::3] = bytes([int(round(lerp(channel[i], channel[j], t))) for i, j, t in segments])
+        # QImage does not copy the buffer, keep it alive on the widget
+        self._image_data = bytes(row)
+        img = QImage(self._image_data, w, 1, 3 * w, QImage.Format_RGB888)
+        painter.drawImage(QRect(0, 0, w, h), img)
         painter.end()
-        self.setPixmap(pix)
+        return pix
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        self.update_preview()
+        self._resize_timer.start()
+
+
+# MultilineEdit stylesheets, built once (the platform font never changes)
+_MULTILINE_BASE_STYLE = f"""
+            QPlainTextEdit {{
+                background-color: #3a4a56;
+                border-radius: 5px;
+                padding: 1px 1px 1px 6px;
+                color: #eaeff2;
+                font-family: {get_platform_monospace_font()};
+                selection-background-color: #4a5a66;
+            }}
+            QPlainTextEdit:focus {{
+                border: 2px solid #eaeff2;
+            }}
+        """
+MULTILINE_SOURCE_STYLE = _MULTILINE_BASE_STYLE.replace(
+    'border-radius: 5px;',
+    f'border: 2px solid {LINK_COLOR};\n                border-radius: 5px;'
+)
+MULTILINE_NORMAL_STYLE = _MULTILINE_BASE_STYLE.replace(
+    'border-radius: 4px;',
+    'border: 1px solid #555;\n                border-radius: 4px;'
+)
+# padding: 4px 8px;
+MULTILINE_ERROR_STYLE = f"""
+            QPlainTextEdit {{
+                background-color: #3a4a56;
+                border: 2px solid #d9534f;
+                border-radius: 5px;
+                padding: 1px 1px 1px 6px;
+                color: #eaeff2;
+                font-family: {get_platform_monospace_font()};
+                selection-background-color: #4a5a66;
+            }}
+            QPlainTextEdit:focus {{
+                border: 2px solid #d9534f;
+            }}
+        """
 
 
-class MultilineEdit(QTextEdit):
-    """QTextEdit that emits editingFinished on focus out, Ctrl+Enter, or Enter when single-line."""
+class MultilineEdit(QPlainTextEdit):
+    """QPlainTextEdit that emits editingFinished on focus out, Ctrl+Enter, or Enter when single-line."""
     editingFinished = Signal()
     focusChanged = Signal(bool)  # Signal for focus changes
     
     def __init__(self, *args, **kwargs):
+        # Plain-text editor: line-based layout is much cheaper than QTextEdit's
+        # rich-text layout for long pasted color lists
         super().__init__(*args, **kwargs)
-        # Avoid accepting rich text from clipboard sources
-        try:
-            self.setAcceptRichText(False)
-        except Exception:
-            pass
         self._is_focused = False
 
     def focusInEvent(self, event):
@@ -244,56 +327,24 @@ class MultilineEdit(QTextEdit):
             # Fallback to default behavior
             super().insertFromMimeData(source)
 
+    def _apply_style(self, style):
+        # Highlighting is re-applied to all three boxes on every conversion
+        # and focus change; skip the stylesheet re-parse when nothing changes
+        if self.styleSheet() != style:
+            self.setStyleSheet(style)
+
     def set_source_highlight(self, is_source=False):
         """Set visual indication that this box is the source for conversion"""
-        # Define the base style
-        base_style = f"""
-            QTextEdit {{
-                background-color: #3a4a56;
-                border-radius: 5px;
-                padding: 1px 1px 1px 6px;
-                color: #eaeff2;
-                font-family: {get_platform_monospace_font()};
-                selection-background-color: #4a5a66;
-            }}
-            QTextEdit:focus {{
-                border: 2px solid #eaeff2;
-            }}
-        """
-        
         if is_source:
             # Source highlighting with blue border
-            source_style = base_style.replace(
-                'border-radius: 5px;',
-                f'border: 2px solid {LINK_COLOR};\n                border-radius: 5px;'
-            )
-            self.setStyleSheet(source_style)
+            self._apply_style(MULTILINE_SOURCE_STYLE)
         else:
             # Normal style with subtle border
-            normal_style = base_style.replace(
-                'border-radius: 4px;',
-                'border: 1px solid #555;\n                border-radius: 4px;'
-            )
-            self.setStyleSheet(normal_style)
+            self._apply_style(MULTILINE_NORMAL_STYLE)
     
     def set_error_style(self):
         """Set error styling for conversion failures"""
-        # padding: 4px 8px;
-        error_style = f"""
-            QTextEdit {{
-                background-color: #3a4a56;
-                border: 2px solid #d9534f;
-                border-radius: 5px;
-                padding: 1px 1px 1px 6px;
-                color: #eaeff2;
-                font-family: {get_platform_monospace_font()};
-                selection-background-color: #4a5a66;
-            }}
-            QTextEdit:focus {{
-                border: 2px solid #d9534f;
-            }}
-        """
-        self.setStyleSheet(error_style)
+        self._apply_style(MULTILINE_ERROR_STYLE)
     
     def clear_error_style(self):
         """Clear error styling and return to normal"""
@@ -311,6 +362,10 @@ class ColorTile(QPushButton):
         self._update_style()
 
     def set_color(self, hexcolor):
+        # Re-applying a stylesheet re-parses and re-polishes the widget,
+        # so skip it when the color did not change
+        if hexcolor == self.hex:
+            return
         self.hex = hexcolor
         self._update_style()
     
@@ -372,7 +427,7 @@ class MainWindow(QWidget):
         for _ in range(self.settings.ab_count):
             lbl = QLabel()
             lbl.setFixedSize(80, DEFAULT_TILE_HEIGHT)  # Initial size, will be updated by update_tile_sizes()
-            lbl.setStyleSheet(f'background: #777; border: 1px solid #222; border-radius: {self.settings.tile_border_radius}px;')
+            lbl.setStyleSheet(self._preview_tile_style('#777'))
             lbl.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
             self.preview_tiles_ab.append(lbl)
         
@@ -381,7 +436,7 @@ class MainWindow(QWidget):
         for _ in range(self.settings.ac_count):
             lbl = QLabel()
             lbl.setFixedSize(80, DEFAULT_TILE_HEIGHT)
-            lbl.setStyleSheet(f'background: #777; border: 1px solid #222; border-radius: {self.settings.tile_border_radius}px;')
+            lbl.setStyleSheet(self._preview_tile_style('#777'))
             lbl.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
             self.preview_tiles_ac.append(lbl)
         
@@ -390,7 +445,7 @@ class MainWindow(QWidget):
         for _ in range(self.settings.cb_count):
             lbl = QLabel()
             lbl.setFixedSize(80, DEFAULT_TILE_HEIGHT)
-            lbl.setStyleSheet(f'background: #777; border: 1px solid #222; border-radius: {self.settings.tile_border_radius}px;')
+            lbl.setStyleSheet(self._preview_tile_style('#777'))
             lbl.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
             self.preview_tiles_cb.append(lbl)
 
@@ -545,24 +600,13 @@ class MainWindow(QWidget):
         # Help icon next to Color space (use simple text '[?]' for cross-platform reliability)
         help_icon = QLabel('[?]')
         help_icon.setStyleSheet(f'color: {LINK_COLOR}; font-size: 13px; padding-left: 6px;')
-        help_icon.setToolTip(
-            """
-<b>Color space descriptions</b><br><br>
-OKLCH — OKLCH (OKLab LCh) — Perceptual Lightness‑Chroma‑Hue (based on the OKLab color space; good for perceptual interpolation)<br><br>
-OKLab — OKLab — Perceptual L‑a‑b color space (lightness and two opponent axes; designed for more uniform perceived differences)<br><br>
-LCh — LCh (CIE LCh / LCh(ab)) — Lightness‑Chroma‑Hue (cylindrical form of CIE Lab*; useful for intuitive hue/chroma edits)<br><br>
-Lab — CIE Lab* (Lab) — Lightness and two color opponent channels (device‑independent, perceptually oriented)<br><br>
-HWB — HWB — Hue‑Whiteness‑Blackness (simple paint‑like model: mix hue with white and black; intuitive for designers)<br><br>
-HSL — HSL — Hue‑Saturation‑Lightness (common cylindrical RGB model for adjusting hue and perceived lightness)
-"""
-        )
+        help_icon.setToolTip(COLOR_SPACE_HELP_HTML)
         # Also make clicking it open a QMessageBox with the same content for accessibility
         def show_help():
-            from PySide6.QtWidgets import QMessageBox
             msg = QMessageBox(self)
             msg.setWindowTitle('Color space help')
             msg.setTextFormat(Qt.RichText)
-            msg.setText(help_icon.toolTip())
+            msg.setText(COLOR_SPACE_HELP_HTML)
             msg.exec()
         try:
             help_icon.mousePressEvent = lambda e: show_help()
@@ -645,123 +689,56 @@ HSL — HSL — Hue‑Saturation‑Lightness (common cylindrical RGB model for a
         else:
             self.conv_hex.setPlainText(self.tile_a.hex)
 
-        # Conversion handlers
-        def on_convert_from_hex():
-            src = self.conv_hex
-            src.clear_error_style()
-            input_text = self.conv_hex.toPlainText()
-            try:
-                # Use the new ColorInputAdapter for flexible parsing
-                hex_colors = ColorInputAdapter.parse_hex_input(input_text)
-                if not hex_colors:
-                    raise ValueError('No valid hex colors found')
-                
-                # Convert to all formats
-                hexs = hex_colors
-                r256 = []
-                r01 = []
-                for hex_color in hex_colors:
-                    r01_tuple = hex_to_rgb01(hex_color)
-                    r01.append(format_rgb01_from_tuple(r01_tuple))
-                    r256_tuple = tuple(int(round(x*255)) for x in r01_tuple)
-                    r256.append(format_rgb256_from_tuple(r256_tuple))
-                
-            except Exception as e:
-                src.set_error_style()
-                self.status.showMessage(f'Conversion failed: invalid Hex input. {e}')
-                return
-            # success - clear any error styles and restore normal styling
-            self.conv_hex.clear_error_style()
-            self.conv_rgb256.clear_error_style()
-            self.conv_rgb01.clear_error_style()
-            self.conv_hex.setPlainText('\n'.join(hexs))
-            self.conv_rgb256.setPlainText('\n'.join(r256))
-            self.conv_rgb01.setPlainText('\n'.join(r01))
-            self.status.showMessage(f'Converted {len(hexs)} lines from Hex.')
-
-        def on_convert_from_rgb256():
-            src = self.conv_rgb256 
-            src.clear_error_style()
-            input_text = self.conv_rgb256.toPlainText()
+        # Conversion handlers.
+        # editingFinished fires on every focus-out, so each handler returns
+        # early when nothing changed since its own last successful conversion
+        self._last_conversion = None
+
+        def converter_texts():
+            return (self.conv_hex.toPlainText(), self.conv_rgb256.toPlainText(), self.conv_rgb01.toPlainText())
+
+        def show_conversion(hexs, r256, r01, old_texts):
+            # Write the three result columns with repaints suspended so the
+            # window lays out once. old_texts are the box texts read before
+            # converting; boxes already holding their result are skipped
+            # without reading the documents back
+            texts = ('\n'.join(hexs), '\n'.join(r256), '\n'.join(r01))
+            self.setUpdatesEnabled(False)
             try:
-                # Use the new ColorInputAdapter for flexible parsing
-                rgb256_tuples = ColorInputAdapter.parse_rgb_input(input_text, is_rgb256=True)
-                if not rgb256_tuples:
-                    raise ValueError('No valid RGB 256 colors found')
-                
-                # Convert to all formats
-                hexs = []
-                r256 = []
-                r01 = []
-                for rgb256_tuple in rgb256_tuples:
-                    r256.append(format_rgb256_from_tuple(rgb256_tuple))
-                    r01_tuple = tuple(v/255.0 for v in rgb256_tuple)
-                    r01.append(format_rgb01_from_tuple(r01_tuple))
-                    hexs.append(rgb01_to_hex(r01_tuple))
-                
-            except Exception as e:
-                src.set_error_style()
-                self.status.showMessage(f'Conversion failed: invalid RGB 256 input. {e}')
+                for box, text, old in zip((self.conv_hex, self.conv_rgb256, self.conv_rgb01), texts, old_texts):
+                    box.clear_error_style()
+                    if old != text:
+                        box.setPlainText(text)
+            finally:
+                self.setUpdatesEnabled(True)
+            return texts
+
+        # (box, converter, label) per source, in converter_texts() order
+        converter_sources = (
+            (self.conv_hex, convert_hex_text, 'Hex'),
+            (self.conv_rgb256, convert_rgb256_text, 'RGB 256'),
+            (self.conv_rgb01, convert_rgb01_text, 'RGB 0-1'),
+        )
+
+        def on_convert_from(index, texts=None):
+            # index: position of the source box in converter_sources
+            # texts: the three box texts, when the caller has already read them
+            if texts is None:
+                texts = converter_texts()
+            if self._last_conversion == (index, texts):
                 return
-            # success - clear any error styles and restore normal styling
-            self.conv_hex.clear_error_style()
-            self.conv_rgb256.clear_error_style()
-            self.conv_rgb01.clear_error_style()
-            self.conv_hex.setPlainText('\n'.join(hexs))
-            self.conv_rgb256.setPlainText('\n'.join(r256))
-            self.conv_rgb01.setPlainText('\n'.join(r01))
-            self.status.showMessage(f'Converted {len(hexs)} lines from RGB 256.')
-
-        def on_convert_from_rgb01():
-            src = self.conv_rgb01
+            src, convert, label = converter_sources[index]
             src.clear_error_style()
-            input_text = self.conv_rgb01.toPlainText()
             try:
-                # Use the new ColorInputAdapter for flexible parsing
-                rgb01_tuples = ColorInputAdapter.parse_rgb_input(input_text, is_rgb256=False)
-                if not rgb01_tuples:
-                    raise ValueError('No valid RGB 0-1 colors found')
-                
-                # Convert to all formats
-                hexs = []
-                r256 = []
-                r01 = []
-                for rgb01_tuple in rgb01_tuples:
-                    r01.append(format_rgb01_from_tuple(rgb01_tuple))
-                    r256_tuple = tuple(int(round(v*255)) for v in rgb01_tuple)
-                    r256.append(format_rgb256_from_tuple(r256_tuple))
-                    hexs.append(rgb01_to_hex(rgb01_tuple))
-                
+                hexs, r256, r01 = convert(texts[index])
             except Exception as e:
                 src.set_error_style()
-                self.status.showMessage(f'Conversion failed: invalid RGB 0-1 input. {e}')
+                self.status.showMessage(f'Conversion failed: invalid {label} input. {e}')
                 return
-            
-            # Ensure RGB(0-1) output has leading zeros for floats
-            r01_with_leading = []
-            for line in r01:
-                parts = [p.strip() for p in line.split(',')]
-                formatted = []
-                for p in parts:
-                    # normalize float format to have leading zero
-                    try:
-                        fv = float(p)
-                        s = f"{fv:.5f}".rstrip('0').rstrip('.')
-                        if s.startswith('.'):
-                            s = '0' + s
-                        formatted.append(s)
-                    except Exception:
-                        formatted.append(p)
-                r01_with_leading.append(', '.join(formatted))
-
             # success - clear any error styles and restore normal styling
-            self.conv_hex.clear_error_style()
-            self.conv_rgb256.clear_error_style()
-            self.conv_rgb01.clear_error_style()
-            self.conv_hex.setPlainText('\n'.join(hexs))
-            self.conv_rgb256.setPlainText('\n'.join(r256))
-            self.conv_rgb01.setPlainText('\n'.join(r01_with_leading))
-            self.status.showMessage(f'Converted {len(hexs)} lines from RGB 0-1.')
+            texts = show_conversion(hexs, r256, r01, texts)
+            self._last_conversion = (index, texts)
+            self.status.showMessage(f'Converted {len(hexs)} lines from {label}.')
 
         # Single Convert button (will act on focused box or first non-empty)
         btn_convert = QPushButton('Convert colors')
@@ -798,43 +775,25 @@ HSL — HSL — Hue‑Saturation‑Lightness (common cylindrical RGB model for a
         def on_convert_focused():
             # Try focused widget first
             fw = QApplication.focusWidget()
-            source_box = None
-            
-            if fw is self.conv_hex:
-                source_box = self.conv_hex
-                on_convert_from_hex()
-            elif fw is self.conv_rgb256:
-                source_box = self.conv_rgb256
-                on_convert_from_rgb256()
-            elif fw is self.conv_rgb01:
-                source_box = self.conv_rgb01
-                on_convert_from_rgb01()
-            else:
-                # Otherwise pick the first non-empty box
-                if self.conv_hex.toPlainText().strip():
-                    source_box = self.conv_hex
-                    on_convert_from_hex()
-                elif self.conv_rgb256.toPlainText().strip():
-                    source_box = self.conv_rgb256
-                    on_convert_from_rgb256()
-                elif self.conv_rgb01.toPlainText().strip():
-                    source_box = self.conv_rgb01
-                    on_convert_from_rgb01()
-                else:
-                    # default
-                    source_box = self.conv_hex
-                    on_convert_from_hex()
-            
+            texts = None
+            boxes = [box for box, _, _ in converter_sources]
+            index = next((i for i, box in enumerate(boxes) if box is fw), None)
+            if index is None:
+                # Otherwise pick the first non-empty box (default Hex); read each box once
+                texts = converter_texts()
+                index = next((i for i, t in enumerate(texts) if t.strip()), 0)
+            on_convert_from(index, texts)
+
             # Update visual highlighting
-            update_source_highlighting(source_box)
+            update_source_highlighting(boxes[index])
 
         btn_convert.clicked.connect(on_convert_focused)
         conv_layout.addWidget(btn_convert, 2, 1, alignment=Qt.AlignCenter)
 
         # Connect editingFinished signals (Enter/focus-out)
-        self.conv_hex.editingFinished.connect(lambda: (on_convert_from_hex(), update_source_highlighting(self.conv_hex)))
-        self.conv_rgb256.editingFinished.connect(lambda: (on_convert_from_rgb256(), update_source_highlighting(self.conv_rgb256)))
-        self.conv_rgb01.editingFinished.connect(lambda: (on_convert_from_rgb01(), update_source_highlighting(self.conv_rgb01)))
+        self.conv_hex.editingFinished.connect(lambda: (on_convert_from(0), update_source_highlighting(self.conv_hex)))
+        self.conv_rgb256.editingFinished.connect(lambda: (on_convert_from(1), update_source_highlighting(self.conv_rgb256)))
+        self.conv_rgb01.editingFinished.connect(lambda: (on_convert_from(2), update_source_highlighting(self.conv_rgb01)))
         
         # Connect focus tracking for visual feedback
         def on_hex_focus_changed(has_focus):
@@ -853,15 +812,25 @@ HSL — HSL — Hue‑Saturation‑Lightness (common cylindrical RGB model for a
         self.conv_rgb256.focusChanged.connect(on_rgb256_focus_changed)
         self.conv_rgb01.focusChanged.connect(on_rgb01_focus_changed)
         
-        # Save converter_hex content when it changes
+        # Track converter_hex content when it changes. The in-memory setting
+        # is updated on every change; the INI is written once typing or
+        # pasting pauses for 500 ms (and again in closeEvent)
         def save_converter_hex():
-            self.settings.converter_hex = self.conv_hex.toPlainText()
             try:
                 self.settings.save()
             except Exception:
                 pass
         
-        self.conv_hex.textChanged.connect(save_converter_hex)
+        self._converter_save_timer = QTimer(self)
+        self._converter_save_timer.setSingleShot(True)
+        self._converter_save_timer.setInterval(500)
+        self._converter_save_timer.timeout.connect(save_converter_hex)
+        
+        def store_converter_hex():
+            self.settings.converter_hex = self.conv_hex.toPlainText()
+            self._converter_save_timer.start()
+        
+        self.conv_hex.textChanged.connect(store_converter_hex)
 
         main_layout.addLayout(conv_layout)
 
@@ -905,6 +874,15 @@ HSL — HSL — Hue‑Saturation‑Lightness (common cylindrical RGB model for a
 
         # Store current gradient colors for copying
         self.current_colors = []
+        # Inputs of the last rendered gradient preview (see on_color_changed)
+        self._last_render_key = None
+        # Coalesce bursts of on_color_changed calls into one update (~60 Hz max)
+        self._color_change_timer = QTimer(self)
+        self._color_change_timer.setSingleShot(True)
+        self._color_change_timer.setInterval(16)
+        self._color_change_timer.timeout.connect(self._apply_color_change)
+        # Tile color dialog, created on first use and reused (see _pick_color)
+        self._color_dialog = None
 
         # initial render - set up UI for current mode
         self.update_mode_ui()
@@ -950,6 +928,8 @@ HSL — HSL — Hue‑Saturation‑Lightness (common cylindrical RGB model for a
         self.update_tile_sizes()
 
     def closeEvent(self, event):
+        # Everything is saved below, drop any pending converter save
+        self._converter_save_timer.stop()
         # Update settings from current UI state and save
         self.settings.model = self.settings.get_model_key(self.model_combo.currentText())
         self.settings.format = self.format_combo.currentText()
@@ -968,8 +948,20 @@ HSL — HSL — Hue‑Saturation‑Lightness (common cylindrical RGB model for a
             pass
         super().closeEvent(event)
 
+    def _pick_color(self, hexcolor, title):
+        """Like QColorDialog.getColor(), but reuses one dialog instead of building a new one per click"""
+        if self._color_dialog is None:
+            self._color_dialog = QColorDialog(self)
+        dialog = self._color_dialog
+        dialog.setWindowTitle(title)
+        dialog.setCurrentColor(QColor(hexcolor))
+        if dialog.exec():
+            return dialog.selectedColor()
+        # Cancelled: an invalid color, as getColor() returns
+        return QColor()
+
     def open_color_a_dialog(self):
-        col = QColorDialog.getColor(QColor(self.tile_a.hex), self, "Choose Tile A")
+        col = self._pick_color(self.tile_a.hex, "Choose Tile A")
         if col.isValid():
             old_color = self.tile_a.hex
             self.tile_a.set_color(col.name())
@@ -983,7 +975,7 @@ HSL — HSL — Hue‑Saturation‑Lightness (common cylindrical RGB model for a
             self.on_color_changed()
 
     def open_color_b_dialog(self):
-        col = QColorDialog.getColor(QColor(self.tile_b.hex), self, "Choose Tile B")
+        col = self._pick_color(self.tile_b.hex, "Choose Tile B")
         if col.isValid():
             old_color = self.tile_b.hex
             self.tile_b.set_color(col.name())
@@ -997,7 +989,7 @@ HSL — HSL — Hue‑Saturation‑Lightness (common cylindrical RGB model for a
             self.on_color_changed()
 
     def open_color_c_dialog(self):
-        col = QColorDialog.getColor(QColor(self.tile_c.hex), self, "Choose Tile C")
+        col = self._pick_color(self.tile_c.hex, "Choose Tile C")
         if col.isValid():
             old_color = self.tile_c.hex
             self.tile_c.set_color(col.name())
@@ -1109,6 +1101,13 @@ HSL — HSL — Hue‑Saturation‑Lightness (common cylindrical RGB model for a
         self.status.showMessage(f"Copied {len(formatted_colors)} colors in {format_type} format to clipboard.")
 
     def on_color_changed(self):
+        """Schedule a gradient update; calls within one timer interval render once"""
+        if not self._color_change_timer.isActive():
+            self._color_change_timer.start()
+
+    def _apply_color_change(self):
+        """Recompute the gradients and update tiles and preview"""
+        self._color_change_timer.stop()
         a = self.tile_a.hex
         b = self.tile_b.hex
         c = self.tile_c.hex
@@ -1122,22 +1121,22 @@ HSL — HSL — Hue‑Saturation‑Lightness (common cylindrical RGB model for a
             cb_steps = 2 + self.settings.cb_count  # C + CB preview tiles + B
             
             try:
-                ac_colors = interpolate(a, c, ac_steps, model)
-                cb_colors = interpolate(c, b, cb_steps, model)
+                ac_colors = interpolate_cached(a, c, ac_steps, model)
+                cb_colors = interpolate_cached(c, b, cb_steps, model)
             except Exception as ex:
                 self.status.showMessage(f"Interpolation error for mode {model}: {ex}. Falling back to sRGB.")
-                ac_colors = interpolate(a, c, ac_steps, 'srgb')
-                cb_colors = interpolate(c, b, cb_steps, 'srgb')
+                ac_colors = interpolate_cached(a, c, ac_steps, 'srgb')
+                cb_colors = interpolate_cached(c, b, cb_steps, 'srgb')
             
             # Update only visible AC preview tiles
             for i, lbl in enumerate(self.preview_tiles_ac):
                 if i < len(ac_colors) - 2:  # Exclude A and C
-                    lbl.setStyleSheet(f'background: {ac_colors[i+1]}; border: 1px solid #222; border-radius: {self.settings.tile_border_radius}px;')
+                    self._set_preview_tile_color(lbl, ac_colors[i+1])
             
             # Update only visible CB preview tiles
             for i, lbl in enumerate(self.preview_tiles_cb):
                 if i < len(cb_colors) - 2:  # Exclude C and B
-                    lbl.setStyleSheet(f'background: {cb_colors[i+1]}; border: 1px solid #222; border-radius: {self.settings.tile_border_radius}px;')
+                    self._set_preview_tile_color(lbl, cb_colors[i+1])
             
             # Combine all colors for copying (AC without last + CB)
             all_colors = ac_colors[:-1] + cb_colors  # Remove duplicate C from AC
@@ -1149,18 +1148,18 @@ HSL — HSL — Hue‑Saturation‑Lightness (common cylindrical RGB model for a
             self.tile_b.set_color(cb_colors[-1])
             
             # Smooth gradient for preview (A to C to B)
-            smooth_ac = interpolate(a, c, 256, model)
-            smooth_cb = interpolate(c, b, 256, model)
+            smooth_ac = interpolate_cached(a, c, 256, model)
+            smooth_cb = interpolate_cached(c, b, 256, model)
             smooth = smooth_ac[:-1] + smooth_cb  # Remove duplicate C
             
         else:
             # 2-color mode: create AB gradient using exact INI count
             steps = 2 + self.settings.ab_count
             try:
-                colors = interpolate(a, b, steps, model)
+                colors = interpolate_cached(a, b, steps, model)
             except Exception as ex:
                 self.status.showMessage(f"Interpolation error for mode {model}: {ex}. Falling back to sRGB.")
-                colors = interpolate(a, b, steps, 'srgb')
+                colors = interpolate_cached(a, b, steps, 'srgb')
 
             # Store colors for copying
             self.current_colors = colors
@@ -1168,22 +1167,35 @@ HSL — HSL — Hue‑Saturation‑Lightness (common cylindrical RGB model for a
             # Update only visible AB preview tiles
             for i, lbl in enumerate(self.preview_tiles_ab):
                 if i < len(colors) - 2:  # Exclude A and B
-                    lbl.setStyleSheet(f'background: {colors[i+1]}; border: 1px solid #222; border-radius: {self.settings.tile_border_radius}px;')
+                    self._set_preview_tile_color(lbl, colors[i+1])
 
             # Update master tiles with exact colors from gradient
             self.tile_a.set_color(colors[0])
             self.tile_b.set_color(colors[-1])
 
             # Smooth gradient for preview
-            smooth = interpolate(colors[0], colors[-1], 512, model)
+            smooth = interpolate_cached(colors[0], colors[-1], 512, model)
         
-        self.gradient_preview.set_colors(smooth)
+        # Only repaint the preview when the inputs of the smooth gradient changed
+        render_key = (self.three_mode, a, b, c, model)
+        if render_key != self._last_render_key:
+            self._last_render_key = render_key
+            self.gradient_preview.set_colors(smooth)
         mode_text = "3-color" if self.three_mode else "2-color"
         self.status.showMessage(f"Mode: {model} ({mode_text}) — Preview updated.")
 
     # --- dynamic tile management ---
     def rebuild_tiles(self):
         """Rebuild the tiles_container layout according to current mode and preview tiles."""
+        # Suspend repaints while tiles are detached, re-added, resized and
+        # recolored, so the window repaints once with the final layout
+        self.setUpdatesEnabled(False)
+        try:
+            self._rebuild_tiles()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _rebuild_tiles(self):
         # Remove all items from tiles_container
         while self.tiles_container.count():
             item = self.tiles_container.takeAt(0)
@@ -1252,7 +1264,49 @@ HSL — HSL — Hue‑Saturation‑Lightness (common cylindrical RGB model for a
         self.update_tile_sizes()
         # Trigger layout update
         self.updateGeometry()
-        self.on_color_changed()
+        # Update synchronously so new tiles never show their placeholder color
+        self._apply_color_change()
+
+    def _insert_preview_tile(self, index, lbl):
+        """Insert one intermediate tile into the current row without rebuilding it."""
+        self.setUpdatesEnabled(False)
+        try:
+            self.tiles_container.insertWidget(index, lbl)
+            lbl.show()
+            self._refresh_tile_row()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _remove_preview_tile(self, lbl):
+        """Remove one intermediate tile from the current row without rebuilding it."""
+        self.setUpdatesEnabled(False)
+        try:
+            self.tiles_container.removeWidget(lbl)
+            try:
+                lbl.setParent(None)
+            except Exception:
+                pass
+            self._refresh_tile_row()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _refresh_tile_row(self):
+        # Tile widths depend on the tile count; recolor synchronously so a
+        # new tile never shows its placeholder color
+        self.update_tile_sizes()
+        self.updateGeometry()
+        self._apply_color_change()
+
+    def _preview_tile_style(self, hexcolor):
+        # Only the background differs between intermediate tiles
+        return f'background: {hexcolor}; border: 1px solid #222; border-radius: {self.settings.tile_border_radius}px;'
+
+    def _set_preview_tile_color(self, lbl, hexcolor):
+        style = self._preview_tile_style(hexcolor)
+        # Each setStyleSheet re-parses the sheet and re-polishes the label,
+        # so skip tiles whose color did not change
+        if lbl.styleSheet() != style:
+            lbl.setStyleSheet(style)
 
     # 2-color mode tile management
     def add_tile_ab(self):
@@ -1262,8 +1316,10 @@ HSL — HSL — Hue‑Saturation‑Lightness (common cylindrical RGB model for a
             return
         lbl = QLabel()
         lbl.setFixedSize(80, DEFAULT_TILE_HEIGHT)  # Initial size, will be updated by update_tile_sizes()
-        lbl.setStyleSheet(f'background: #777; border: 1px solid #222; border-radius: {self.settings.tile_border_radius}px;')
+        lbl.setStyleSheet(self._preview_tile_style('#777'))
         lbl.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        # Row layout: A + AB tiles + B; append after the last AB tile
+        index = 1 + len(self.preview_tiles_ab)
         self.preview_tiles_ab.append(lbl)
         # Update settings and save immediately
         self.settings.ab_count = len(self.preview_tiles_ab)
@@ -1271,7 +1327,7 @@ HSL — HSL — Hue‑Saturation‑Lightness (common cylindrical RGB model for a
             self.settings.save()
         except Exception:
             pass
-        self.rebuild_tiles()
+        self._insert_preview_tile(index, lbl)
 
     def remove_tile_ab(self):
         """Remove an intermediate tile from AB gradient if above the minimum."""
@@ -1279,17 +1335,13 @@ HSL — HSL — Hue‑Saturation‑Lightness (common cylindrical RGB model for a
             self.status.showMessage(f'Already at minimum of {2 + self.min_tiles_between} tiles.')
             return
         lbl = self.preview_tiles_ab.pop()
-        try:
-            lbl.setParent(None)
-        except Exception:
-            pass
         # Update settings and save immediately
         self.settings.ab_count = len(self.preview_tiles_ab)
         try:
             self.settings.save()
         except Exception:
             pass
-        self.rebuild_tiles()
+        self._remove_preview_tile(lbl)
 
     # 3-color mode tile management
     def add_tile_ac(self):
@@ -1299,8 +1351,10 @@ HSL — HSL — Hue‑Saturation‑Lightness (common cylindrical RGB model for a
             return
         lbl = QLabel()
         lbl.setFixedSize(80, DEFAULT_TILE_HEIGHT)
-        lbl.setStyleSheet(f'background: #777; border: 1px solid #222; border-radius: {self.settings.tile_border_radius}px;')
+        lbl.setStyleSheet(self._preview_tile_style('#777'))
         lbl.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        # Row layout: A + AC tiles + C + CB tiles + B; append after the last AC tile
+        index = 1 + len(self.preview_tiles_ac)
         self.preview_tiles_ac.append(lbl)
         # Update settings and save immediately
         self.settings.ac_count = len(self.preview_tiles_ac)
@@ -1308,7 +1362,7 @@ HSL — HSL — Hue‑Saturation‑Lightness (common cylindrical RGB model for a
             self.settings.save()
         except Exception:
             pass
-        self.rebuild_tiles()
+        self._insert_preview_tile(index, lbl)
 
     def remove_tile_ac(self):
         """Remove an intermediate tile from AC gradient (left side)."""
@@ -1316,17 +1370,13 @@ HSL — HSL — Hue‑Saturation‑Lightness (common cylindrical RGB model for a
             self.status.showMessage(f'AC gradient already at minimum of {self.min_tiles_between} tiles.')
             return
         lbl = self.preview_tiles_ac.pop()
-        try:
-            lbl.setParent(None)
-        except Exception:
-            pass
         # Update settings and save immediately
         self.settings.ac_count = len(self.preview_tiles_ac)
         try:
             self.settings.save()
         except Exception:
             pass
-        self.rebuild_tiles()
+        self._remove_preview_tile(lbl)
 
     def add_tile_cb(self):
         """Add an intermediate tile to CB gradient (right side)."""
@@ -1335,8 +1385,10 @@ HSL — HSL — Hue‑Saturation‑Lightness (common cylindrical RGB model for a
             return
         lbl = QLabel()
         lbl.setFixedSize(80, DEFAULT_TILE_HEIGHT)
-        lbl.setStyleSheet(f'background: #777; border: 1px solid #222; border-radius: {self.settings.tile_border_radius}px;')
+        lbl.setStyleSheet(self._preview_tile_style('#777'))
         lbl.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        # Row layout: A + AC tiles + C + CB tiles + B; append after the last CB tile
+        index = 2 + len(self.preview_tiles_ac) + len(self.preview_tiles_cb)
         self.preview_tiles_cb.append(lbl)
         # Update settings and save immediately
         self.settings.cb_count = len(self.preview_tiles_cb)
@@ -1344,7 +1396,7 @@ HSL — HSL — Hue‑Saturation‑Lightness (common cylindrical RGB model for a
             self.settings.save()
         except Exception:
             pass
-        self.rebuild_tiles()
+        self._insert_preview_tile(index, lbl)
 
     def remove_tile_cb(self):
         """Remove an intermediate tile from CB gradient (right side)."""
@@ -1352,17 +1404,13 @@ HSL — HSL — Hue‑Saturation‑Lightness (common cylindrical RGB model for a
             self.status.showMessage(f'CB gradient already at minimum of {self.min_tiles_between} tiles.')
             return
         lbl = self.preview_tiles_cb.pop()
-        try:
-            lbl.setParent(None)
-        except Exception:
-            pass
         # Update settings and save immediately
         self.settings.cb_count = len(self.preview_tiles_cb)
         try:
             self.settings.save()
         except Exception:
             pass
-        self.rebuild_tiles()
+        self._remove_preview_tile(lbl)
 
 
 if __name__ == '__main__':
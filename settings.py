@@ -3,11 +3,39 @@
 # Handles INI file loading/saving and application state persistence
 
 import configparser
+import io
 from pathlib import Path
+from types import MappingProxyType
+
+
+# Friendly model label -> internal interpolation key (read-only)
+MODEL_LABEL_TO_KEY = MappingProxyType({
+    'OKLCH (OKLab LCh)': 'oklch',
+    'LCh (CIE LCh)': 'lch',
+    'OKLab': 'oklab',
+    'CIE Lab': 'lab',
+    'HWB (Hue‑Whiteness‑Blackness)': 'hwb',
+    'HSL (Hue‑Saturation‑Lightness)': 'hsl',
+    'sRGB': 'srgb',
+})
+# Reverse mapping for Settings.get_model_label
+MODEL_KEY_TO_LABEL = MappingProxyType({key: label for label, key in MODEL_LABEL_TO_KEY.items()})
 
 
 class Settings:
     """Manages application settings and INI file persistence"""
+
+    # Fixed set of settings attributes; no per-instance __dict__
+    __slots__ = (
+        'config_path', 'model', 'format', 'color_a', 'color_b', 'color_c',
+        'converter_hex', 'three_mode', 'ab_count', 'ac_count', 'cb_count',
+        'swatch_gap', 'master_tile_border_color', 'tile_border_radius',
+        '_cfg', '_saved',
+    )
+
+    # Model mappings for friendly labels (shared by all instances)
+    model_label_to_key = MODEL_LABEL_TO_KEY
+    model_key_to_label = MODEL_KEY_TO_LABEL
     
     def __init__(self, config_path):
         self.config_path = Path(config_path)
@@ -26,26 +54,25 @@ class Settings:
         self.swatch_gap = 9
         self.master_tile_border_color = '#E3E3E3'
         self.tile_border_radius = 6
-        
-        # Model mappings for friendly labels
-        self.model_label_to_key = {
-            'OKLCH (OKLab LCh)': 'oklch',
-            'LCh (CIE LCh)': 'lch',
-            'OKLab': 'oklab',
-            'CIE Lab': 'lab',
-            'HWB (Hue‑Whiteness‑Blackness)': 'hwb',
-            'HSL (Hue‑Saturation‑Lightness)': 'hsl',
-            'sRGB': 'srgb',
-        }
+
+        # Parser reused by every save(); building a ConfigParser costs more
+        # than serializing this small section
+        self._cfg = configparser.ConfigParser()
+        # [ui] values last written by save(), to skip rewriting an unchanged file
+        self._saved = None
     
     def load(self):
         """Load settings from INI file"""
         cfg = configparser.ConfigParser()
-        if not self.config_path.exists():
+        # Read the file once instead of an exists() check followed by cfg.read()
+        try:
+            text = self.config_path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
+            # Missing or unreadable file: keep the defaults
             return
         
         try:
-            cfg.read(self.config_path)
+            cfg.read_string(text)
             if cfg.has_section('ui'):
                 self.model = cfg.get('ui', 'model', fallback=self.model)
                 self.format = cfg.get('ui', 'format', fallback=self.format)
@@ -70,8 +97,7 @@ class Settings:
     
     def save(self):
         """Save current settings to INI file"""
-        cfg = configparser.ConfigParser()
-        cfg['ui'] = {
+        values = {
             'model': self.model,
             'format': self.format,
             'color_a': self.color_a,
@@ -87,9 +113,20 @@ class Settings:
             'master_tile_border_color': self.master_tile_border_color,
             'tile_border_radius': str(self.tile_border_radius),
         }
+        # save() is called after every UI change; nothing to do if the
+        # values match what this instance last wrote
+        if values == self._saved:
+            return
+        cfg = self._cfg
+        # Assigning a section replaces all of its previous options
+        cfg['ui'] = values
         
-        with open(self.config_path, 'w', encoding='utf-8') as f:
-            cfg.write(f)
+        # Serialize in memory and write the file in one call instead of one
+        # small write per line
+        buf = io.StringIO()
+        cfg.write(buf)
+        self.config_path.write_text(buf.getvalue(), encoding='utf-8')
+        self._saved = values
     
     def get_model_mappings(self):
         """Return friendly label -> internal key mappings"""
@@ -101,7 +138,4 @@ class Settings:
     
     def get_model_label(self, internal_key):
         """Get friendly label from internal model key"""
-        for label, key in self.model_label_to_key.items():
-            if key == internal_key.lower():
-                return label
-        return internal_key
\ No newline at end of file
+        return self.model_key_to_label.get(internal_key.lower(), internal_key)
\ No newline at end of file
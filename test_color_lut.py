@@ -0,0 +1,45 @@
+# Test the sRGB <-> linear lookup tables against the reference formulas
+from color import (
+    srgb_comp_to_linear, linear_comp_to_srgb, linear_comp_to_srgb8,
+    SRGB8_TO_LINEAR, LINEAR_TO_SRGB8_THRESHOLDS
+)
+
+
+def reference_srgb8(c):
+    return max(0, min(255, int(round(linear_comp_to_srgb(c) * 255))))
+
+
+def test_srgb8_to_linear_lut():
+    """Every 8-bit value must map to exactly the formula result"""
+    for i in range(256):
+        assert SRGB8_TO_LINEAR[i] == srgb_comp_to_linear(i / 255.0)
+
+
+def test_linear_to_srgb8_round_trip():
+    """Encoding the linear value of every 8-bit value returns that value"""
+    for i in range(256):
+        assert linear_comp_to_srgb8(SRGB8_TO_LINEAR[i]) == i
+
+
+def test_linear_to_srgb8_thresholds():
+    """Values on and just below each decision threshold match the reference"""
+    for c in LINEAR_TO_SRGB8_THRESHOLDS:
+        below = c * (1 - 1e-15)
+        assert linear_comp_to_srgb8(c) == reference_srgb8(c)
+        assert linear_comp_to_srgb8(below) == reference_srgb8(below)
+
+
+def test_linear_to_srgb8_grid():
+    """A dense grid over [0, 1] matches the reference encoding"""
+    n = 20000
+    for k in range(n + 1):
+        c = k / n
+        assert linear_comp_to_srgb8(c) == reference_srgb8(c)
+
+
+if __name__ == "__main__":
+    test_srgb8_to_linear_lut()
+    test_linear_to_srgb8_round_trip()
+    test_linear_to_srgb8_thresholds()
+    test_linear_to_srgb8_grid()
+    print("LUT testing completed!")
@@ -0,0 +1,41 @@
+# Test the converter text transforms used by the converter boxes in main.py
+from color import convert_hex_text, convert_rgb256_text, convert_rgb01_text
+
+
+def test_convert_hex_text():
+    hexs, r256, r01 = convert_hex_text("#288ceb,\na778ae;\nE15E1E")
+    assert hexs == ('#288ceb', '#a778ae', '#e15e1e')
+    assert r256 == ('40, 140, 235', '167, 120, 174', '225, 94, 30')
+    assert r01[0] == '0.15686, 0.54902, 0.92157'
+
+
+def test_convert_rgb256_text():
+    hexs, r256, r01 = convert_rgb256_text("rgb(40, 140, 235)\n[0, 0, 0]")
+    assert hexs == ('#288ceb', '#000000')
+    assert r256 == ('40, 140, 235', '0, 0, 0')
+    assert r01 == ('0.15686, 0.54902, 0.92157', '0, 0, 0')
+
+
+def test_convert_rgb01_text():
+    hexs, r256, r01 = convert_rgb01_text("(0.157, 0.549, 0.922)\n1, .5, 0")
+    assert hexs == ('#288ceb', '#ff8000')
+    assert r256 == ('40, 140, 235', '255, 128, 0')
+    assert r01 == ('0.157, 0.549, 0.922', '1, 0.5, 0')
+
+
+def test_convert_invalid_text():
+    for convert in (convert_hex_text, convert_rgb256_text, convert_rgb01_text):
+        try:
+            convert("not a color")
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f'{convert.__name__} accepted invalid text')
+
+
+if __name__ == "__main__":
+    test_convert_hex_text()
+    test_convert_rgb256_text()
+    test_convert_rgb01_text()
+    test_convert_invalid_text()
+    print("Converter testing completed!")
@@ -0,0 +1,31 @@
+# Test that 8-digit '#rrggbbaa' colors (e.g. from a hand-edited INI) are
+# handled like their '#rrggbb' part, as the original slicing helpers did
+from color import (
+    hex_to_rgb01, hex_to_linear_rgb, hex_to_rgb256, hex_to_rgb01_string, interpolate
+)
+
+
+def test_hex_helpers_ignore_alpha():
+    for helper in (hex_to_rgb01, hex_to_linear_rgb, hex_to_rgb256, hex_to_rgb01_string):
+        assert helper('#ff000080') == helper('#ff0000')
+        assert helper('12345678') == helper('123456')
+
+
+def test_interpolate_ignores_alpha():
+    for mode in ('srgb', 'oklab', 'oklch'):
+        assert interpolate('#ff000080', '#0000ff', 3, mode) == interpolate('#ff0000', '#0000ff', 3, mode)
+
+
+def test_interpolate_coloraide_returns_rgb_hex():
+    """Coloraide-backed modes return '#rrggbb' stops even for '#rrggbbaa' endpoints"""
+    for mode in ('lab', 'lch', 'hsl', 'hwb'):
+        result = interpolate('#ff000080', '#0000ff', 5, mode)
+        assert all(len(c) == 7 and c.startswith('#') for c in result), (mode, result)
+        assert result == interpolate('#ff0000', '#0000ff', 5, mode)
+
+
+if __name__ == "__main__":
+    test_hex_helpers_ignore_alpha()
+    test_interpolate_ignores_alpha()
+    test_interpolate_coloraide_returns_rgb_hex()
+    print("Hex alpha testing completed!")
@@ -0,0 +1,41 @@
+# Test the OKLab/OKLCH fast path against coloraide's interpolation
+import random
+from color import interpolate, interpolate_oklab, interpolate_coloraide
+
+
+def sample_pairs():
+    random.seed(7)
+    colors = ['#%06x' % random.randrange(1 << 24) for _ in range(40)]
+    grays = ['#000000', '#010101', '#808080', '#ffffff']
+    pairs = list(zip(colors, colors[1:]))
+    pairs += [(g, c) for g in grays for c in colors[:3]]
+    pairs += [(c, g) for g in grays for c in colors[:3]]
+    pairs += [(g1, g2) for g1 in grays for g2 in grays]
+    return pairs
+
+
+def test_oklab_matches_coloraide():
+    for a, b in sample_pairs():
+        for steps in (1, 2, 7, 64):
+            assert interpolate_oklab(a, b, steps, 'oklab') == interpolate_coloraide(a, b, steps, 'oklab'), (a, b, steps)
+
+
+def test_oklch_matches_coloraide():
+    for a, b in sample_pairs():
+        for steps in (1, 2, 7, 64):
+            assert interpolate_oklab(a, b, steps, 'oklch') == interpolate_coloraide(a, b, steps, 'oklch'), (a, b, steps)
+
+
+def test_non_hex_endpoints_use_coloraide():
+    """Shorthand hex and named colors are not parsed by the fast path"""
+    for space in ('oklab', 'oklch'):
+        for a, b in (('#fff', '#000000'), ('#FFF', 'red'), ('red', '#0000ff')):
+            assert interpolate(a, b, 3, space) == interpolate_coloraide(a, b, 3, space), (a, b, space)
+    assert interpolate('#fff', '#000000', 3, 'oklch') == ['#ffffff', '#636363', '#000000']
+
+
+if __name__ == "__main__":
+    test_oklab_matches_coloraide()
+    test_oklch_matches_coloraide()
+    test_non_hex_endpoints_use_coloraide()
+    print("OKLab fast path testing completed!")
@@ -0,0 +1,68 @@
+# Test Settings INI persistence
+import tempfile
+from pathlib import Path
+
+from settings import Settings
+
+
+def test_settings_round_trip():
+    """Saved settings load back unchanged, including multi-line converter text"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'ColorGradient.ini'
+        s = Settings(path)
+        s.model = 'lab'
+        s.color_a = '#123456'
+        s.converter_hex = '#1366db\n#665dda'
+        s.three_mode = True
+        s.ab_count = 5
+        s.save()
+
+        loaded = Settings(path)
+        loaded.load()
+        assert loaded.model == 'lab'
+        assert loaded.color_a == '#123456'
+        assert loaded.converter_hex == '#1366db\n#665dda'
+        assert loaded.three_mode is True
+        assert loaded.ab_count == 5
+        assert loaded.cb_count == s.cb_count
+
+
+def test_settings_missing_file():
+    """A missing INI file leaves the defaults in place"""
+    with tempfile.TemporaryDirectory() as tmp:
+        s = Settings(Path(tmp) / 'missing.ini')
+        s.load()
+        assert s.model == 'oklch'
+        assert s.three_mode is False
+
+
+def test_settings_save_skips_unchanged():
+    """save() only rewrites the file when a value changed since the last save"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'ColorGradient.ini'
+        s = Settings(path)
+        s.save()
+        path.write_text('marker', encoding='utf-8')
+        s.save()
+        assert path.read_text(encoding='utf-8') == 'marker'
+        s.color_b = '#abcdef'
+        s.save()
+        assert 'color_b = #abcdef' in path.read_text(encoding='utf-8')
+
+
+def test_model_label_mapping():
+    """Model keys and friendly labels map both ways; unknown keys pass through"""
+    s = Settings('unused.ini')
+    for label, key in s.get_model_mappings().items():
+        assert s.get_model_key(label) == key
+        assert s.get_model_label(key) == label
+        assert s.get_model_label(key.upper()) == label
+    assert s.get_model_label('unknown') == 'unknown'
+
+
+if __name__ == "__main__":
+    test_settings_round_trip()
+    test_settings_missing_file()
+    test_settings_save_skips_unchanged()
+    test_model_label_mapping()
+    print("Settings testing completed!")